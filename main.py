@@ -2,20 +2,22 @@ from __future__ import annotations
 
 import os
 import socket
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import date, datetime
 
 from typing import Dict, List
 from uuid import UUID
 
 from fastapi import FastAPI, HTTPException
-from fastapi import Query, Path
+from fastapi import Query, Path, Response
 from typing import Optional
 
+from models import rebuild_models
 from models.person import PersonCreate, PersonRead, PersonUpdate
 from models.address import AddressCreate, AddressRead, AddressUpdate
 from models.health import Health
-from models.order import OrderBase, OrderCreate, OrderRead
-from models.payment import PaymentBase, PaymentCreate, PaymentRead
+from models.order import OrderBase, OrderCreate, OrderRead, orders_to_json
+from models.payment import PaymentBase, PaymentBatch, PaymentCreate, PaymentRead, payments_to_json
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
@@ -27,12 +29,28 @@ addresses: Dict[UUID, AddressRead] = {}
 orders: Dict[UUID, OrderRead] = {}
 payments: Dict[UUID, PaymentRead] = {}
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Order/Payment models resolve PersonBase lazily; build them before serving.
+    rebuild_models()
+    yield
+
 app = FastAPI(
     title="Person/Address API",
     description="Demo FastAPI app using Pydantic v2 models for Person and Address",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+def json_response(content: str | bytes, status_code: int = 200) -> Response:
+    # Pass JSON already produced by pydantic-core; returning a Response makes
+    # FastAPI skip jsonable_encoder and re-validation against the response_model.
+    return Response(
+        content=content,
+        media_type="application/json",
+        status_code=status_code,
+    )
+
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
@@ -168,13 +186,13 @@ def update_person(person_id: UUID, update: PersonUpdate):
 # -----------------------------------------------------------------------------
 @app.post("/orders", response_model=OrderRead)
 def create_order(order: OrderCreate, status_code=201):
-    # Generate the read model from the incoming create payload
-    order_read = OrderRead(**order.model_dump())
+    # from_row skips validation, so pass dict() (nested models intact), not model_dump()
+    order_read = OrderRead.from_row(dict(order))
     # Store it in the orders dictionary keyed by id
     orders[order_read.id] = order_read
-    return order_read
+    return json_response(order_read.model_dump_json())
 
-@app.get("/orders", response_model=List[OrderBase])
+@app.get("/orders", response_model=List[OrderRead])
 def list_orders(
     uni: Optional[str] = Query(None, description="Filter by customer's UNI"),
     first_name: Optional[str] = Query(None, description="Filter by customer's first name"),
@@ -183,8 +201,8 @@ def list_orders(
     phone: Optional[str] = Query(None, description="Filter by customer's phone number"),
     item: Optional[str] = Query(None, description="Filter by item name"),
     quantity: Optional[int] = Query(None, description="Filter by quantity"),
-    price_per_item: Optional[float] = Query(None, description="Filter by price per item"),
-    order_date: Optional[str] = Query(None, description="Filter by order date (YYYY-MM-DD)"),
+    price_per_item_cents: Optional[int] = Query(None, description="Filter by price per item (in cents)"),
+    order_date: Optional[date] = Query(None, description="Filter by order date (YYYY-MM-DD)"),
     city: Optional[str] = Query(None, description="Filter by city in customer's addresses"),
     country: Optional[str] = Query(None, description="Filter by country in customer's addresses"),
 ):
@@ -195,10 +213,10 @@ def list_orders(
         results = [o for o in results if o.item == item]
     if quantity is not None:
         results = [o for o in results if o.quantity == quantity]
-    if price_per_item is not None:
-        results = [o for o in results if o.price_per_item == price_per_item]
+    if price_per_item_cents is not None:
+        results = [o for o in results if o.price_per_item_cents == price_per_item_cents]
     if order_date is not None:
-        results = [o for o in results if str(o.order_date) == order_date]
+        results = [o for o in results if o.order_date == order_date]
 
     # Filter by nested customer fields
     if uni is not None:
@@ -224,7 +242,7 @@ def list_orders(
             if o.customer and any(addr.country == country for addr in o.customer.addresses)
         ]
 
-    return results
+    return json_response(orders_to_json(results))
 
 
 @app.get("/orders/{order_id}", response_model=OrderBase)
@@ -238,18 +256,26 @@ def get_order(order_id: UUID):
 # -----------------------------------------------------------------------------
 @app.post("/payments", response_model=PaymentRead, status_code=201)
 def create_payment(payment: PaymentCreate):
-    # Generate the read model from the incoming create payload
-    payment_read = PaymentRead(**payment.model_dump())
+    # from_row skips validation, so pass dict() (nested models intact), not model_dump()
+    payment_read = PaymentRead.from_row(dict(payment))
     # Store it in the payments dictionary keyed by id
     payments[payment_read.id] = payment_read
-    return payment_read
+    return json_response(payment_read.model_dump_json(), status_code=201)
+
+@app.post("/payments/bulk", response_model=List[PaymentRead], status_code=201)
+def create_payments_bulk(batch: PaymentBatch):
+    # Columns were validated once as lists; build each stored row without re-validating
+    created = [PaymentRead.from_row(row) for row in batch.rows()]
+    for payment_read in created:
+        payments[payment_read.id] = payment_read
+    return json_response(payments_to_json(created), status_code=201)
 
-@app.get("/payments", response_model=List[PaymentBase])
+@app.get("/payments", response_model=List[PaymentRead])
 def list_payments(
     # Replace these filters with fields relevant to your Payment model
     payment_method: Optional[str] = Query(None, description="Filter by payment method"),
     status: Optional[str] = Query(None, description="Filter by payment status"),
-    amount: Optional[float] = Query(None, description="Filter by payment amount"),
+    amount_cents: Optional[int] = Query(None, description="Filter by payment amount (in cents)"),
     currency: Optional[str] = Query(None, description="Filter by currency code"),
     payer_id: Optional[UUID] = Query(None, description="Filter by payer ID"),
     payment_date: Optional[str] = Query(None, description="Filter by payment date (YYYY-MM-DD)"),
@@ -261,8 +287,8 @@ def list_payments(
         results = [p for p in results if p.payment_method == payment_method]
     if status is not None:
         results = [p for p in results if p.status == status]
-    if amount is not None:
-        results = [p for p in results if p.amount == amount]
+    if amount_cents is not None:
+        results = [p for p in results if p.amount_cents == amount_cents]
     if currency is not None:
         results = [p for p in results if p.currency == currency]
     if payer_id is not None:
@@ -270,7 +296,7 @@ def list_payments(
     if payment_date is not None:
         results = [p for p in results if str(p.payment_date) == payment_date]
 
-    return results
+    return json_response(payments_to_json(results))
 
 @app.get("/payments/{payment_id}", response_model=PaymentBase)
 def get_payment(payment_id: UUID):
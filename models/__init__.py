@@ -0,0 +1,26 @@
+def rebuild_models() -> None:
+    """Build the deferred Order/Payment schemas in a single pass.
+
+    The order and payment models set ``defer_build`` and only import
+    PersonBase for type checking, so nothing is built until this runs.
+    main.py calls it from the app lifespan so schema errors still surface
+    at startup; code using these models outside the app must call it first,
+    or validation raises ``PydanticUserError`` (model not fully defined).
+    All classes share one prebuilt types namespace, and the module-level
+    list adapters are compiled here too, once for all requests.
+    """
+    from datetime import date, datetime
+    from uuid import UUID
+
+    from . import order, payment
+    from .person import PersonBase
+
+    namespace = {"PersonBase": PersonBase, "UUID": UUID, "date": date, "datetime": datetime}
+    for cls in (
+        order.OrderBase, order.OrderCreate, order.OrderUpdate, order.OrderRead,
+        payment.PaymentBase, payment.PaymentCreate, payment.PaymentUpdate, payment.PaymentRead,
+        payment.PaymentBatch,
+    ):
+        cls.model_rebuild(force=True, _types_namespace=namespace)
+    for adapter in (order.ORDER_LIST_ADAPTER, payment.PAYMENT_LIST_ADAPTER):
+        adapter.rebuild(force=True, _types_namespace=namespace)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+import os
+from datetime import datetime, timezone
+
+# Schema examples only feed the OpenAPI docs; OPENAPI_DOCS=0 drops them.
+OPENAPI_DOCS = os.environ.get("OPENAPI_DOCS", "1") == "1"
+
+
+# Person payload shared by the Order/Payment schema examples.
+PERSON_EXAMPLE = {
+    "uni": "abc1234",
+    "first_name": "Ada",
+    "last_name": "Lovelace",
+    "email": "ada@example.com",
+    "phone": "+1-212-555-0199",
+    "birth_date": "1815-12-10",
+    "addresses": [
+        {
+            "id": "550e8400-e29b-41d4-a716-446655440000",
+            "street": "123 Main St",
+            "city": "London",
+            "state": None,
+            "postal_code": "SW1A 1AA",
+            "country": "UK",
+        }
+    ],
+}
+
+
+def schema_example(value):
+    return {"example": value} if OPENAPI_DOCS else None
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def created_at_or_now(data: dict) -> datetime:
+    # A fresh record gets a single timestamp for both created_at and updated_at.
+    return data.get("created_at") or utcnow()
@@ -1,187 +1,85 @@
 from __future__ import annotations
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Annotated, Optional
+from pydantic import BaseModel, Field, TypeAdapter
 from uuid import UUID, uuid4
 from datetime import date, datetime
-from .person import PersonBase
+
+from ._common import OPENAPI_DOCS, PERSON_EXAMPLE, created_at_or_now, schema_example, utcnow
+
+if TYPE_CHECKING:
+    from .person import PersonBase
+
+_ORDER_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "customer": PERSON_EXAMPLE,
+    "item": "Laptop",
+    "quantity": 2,
+    "price_per_item_cents": 99999,
+    "order_date": "2023-10-05",
+}
+
+# Field metadata shared by OrderBase and OrderUpdate.
+_ITEM = Field(
+    description="Item being ordered.",
+    json_schema_extra=schema_example("Laptop"),
+)
+
+_QUANTITY = Field(
+    description="Quantity of the item ordered.",
+    json_schema_extra=schema_example(2),
+)
+
+_PRICE_PER_ITEM_CENTS = Field(
+    ge=0,
+    description="Price per individual item, in cents.",
+    json_schema_extra=schema_example(99999),
+)
+
+_ORDER_DATE = Field(
+    description="Date when the order was placed (YYYY-MM-DD).",
+    json_schema_extra=schema_example("2023-10-05"),
+)
 
 
 class OrderBase(BaseModel):
     id: UUID = Field(
         default_factory=uuid4,
         description="Persistent Address ID (server-generated).",
-        json_schema_extra={"example": "550e8400-e29b-41d4-a716-446655440000"},
+        json_schema_extra=schema_example("550e8400-e29b-41d4-a716-446655440000"),
     )
 
     customer: PersonBase = Field(
         None,
         description="Customer",
-        json_schema_extra={ 
-            "example": [
-                {
-                    "uni": "abc1234",
-                    "first_name": "Ada",
-                    "last_name": "Lovelace",
-                    "email": "ada@example.com",
-                    "phone": "+1-212-555-0199",
-                    "birth_date": "1815-12-10",
-                    "addresses": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "street": "123 Main St",
-                            "city": "London",
-                            "state": None,
-                            "postal_code": "SW1A 1AA",
-                            "country": "UK",
-                        }
-                    ],
-                }
-            ]
-        },
-    )
-    item: str = Field(
-        ...,
-        description="Item being ordered.",
-        json_schema_extra={"example": "Laptop"},
-    )
-    quantity: int = Field(
-        ...,
-        description="Quantity of the item ordered.",
-        json_schema_extra={"example": 2},
-    )
-    price_per_item: float = Field(
-        ...,
-        description="Price per individual item.",
-        json_schema_extra={"example": 999.99},
-    )
-    order_date: date = Field(
-        ...,
-        description="Date when the order was placed (YYYY-MM-DD).",
-        json_schema_extra={"example": "2023-10-05"},
+        json_schema_extra=schema_example([PERSON_EXAMPLE]),
     )
+    item: Annotated[str, _ITEM]
+    quantity: Annotated[int, _QUANTITY]
+    price_per_item_cents: Annotated[int, _PRICE_PER_ITEM_CENTS]
+    order_date: Annotated[date, _ORDER_DATE]
 
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "customer": {
-                        "uni": "abc1234",
-                        "first_name": "Ada",
-                        "last_name": "Lovelace",
-                        "email": "ada@example.com",
-                        "phone": "+1-212-555-0199",
-                        "birth_date": "1815-12-10",
-                        "addresses": [
-                            {
-                                "id": "550e8400-e29b-41d4-a716-446655440000",
-                                "street": "123 Main St",
-                                "city": "London",
-                                "state": None,
-                                "postal_code": "SW1A 1AA",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "item": "Laptop",
-                    "quantity": 2,
-                    "price_per_item": 999.99,
-                    "order_date": "2023-10-05"
-                }
-            ]
-        }
+        "defer_build": True,
+        "json_schema_extra": {"examples": [_ORDER_EXAMPLE]} if OPENAPI_DOCS else None,
     }
    
 class OrderCreate(OrderBase):
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "customer": {
-                        "uni": "abc1234",
-                        "first_name": "Ada",
-                        "last_name": "Lovelace",
-                        "email": "ada@example.com",
-                        "phone": "+1-212-555-0199",
-                        "birth_date": "1815-12-10",
-                        "addresses": [
-                            {
-                                "id": "550e8400-e29b-41d4-a716-446655440000",
-                                "street": "123 Main St",
-                                "city": "London",
-                                "state": None,
-                                "postal_code": "SW1A 1AA",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "item": "Laptop",
-                    "quantity": 2,
-                    "price_per_item": 999.99,
-                    "order_date": "2023-10-05"
-                }
-            ]
-        }
-    }
+    pass
 
 class OrderUpdate(BaseModel):
     customer: Optional[PersonBase] = Field(
         None,
         description="Customer"
     )
-    item: Optional[str] = Field(
-        None,
-        description="Item being ordered.",
-        json_schema_extra={"example": "Laptop"},
-    )
-    quantity: Optional[int] = Field(
-        None,
-        description="Quantity of the item ordered.",
-        json_schema_extra={"example": 2},
-    )
-    price_per_item: Optional[float] = Field(
-        None,
-        description="Price per individual item.",
-        json_schema_extra={"example": 999.99},
-    )
-    order_date: Optional[date] = Field(
-        None,
-        description="Date when the order was placed (YYYY-MM-DD).",
-        json_schema_extra={"example": "2023-10-05"},
-    )
+    item: Annotated[Optional[str], _ITEM] = None
+    quantity: Annotated[Optional[int], _QUANTITY] = None
+    price_per_item_cents: Annotated[Optional[int], _PRICE_PER_ITEM_CENTS] = None
+    order_date: Annotated[Optional[date], _ORDER_DATE] = None
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "customer": {
-                        "uni": "abc1234",
-                        "first_name": "Ada",
-                        "last_name": "Lovelace",
-                        "email": "ada@example.com",
-                        "phone": "+1-212-555-0199",
-                        "birth_date": "1815-12-10",
-                        "addresses": [
-                            {
-                                "id": "550e8400-e29b-41d4-a716-446655440000",
-                                "street": "123 Main St",
-                                "city": "London",
-                                "state": None,
-                                "postal_code": "SW1A 1AA",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "item": "Laptop",
-                    "quantity": 2,
-                    "price_per_item": 999.99,
-                    "order_date": "2023-10-05"
-                }
-            ]
-        }
+        "defer_build": True,
+        "json_schema_extra": {"examples": [_ORDER_EXAMPLE]} if OPENAPI_DOCS else None,
     }
 
 class OrderRead(OrderBase):
@@ -189,48 +87,24 @@ class OrderRead(OrderBase):
     id: UUID = Field(
         default_factory=uuid4,
         description="Server-generated Person ID.",
-        json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
+        json_schema_extra=schema_example("99999999-9999-4999-8999-999999999999"),
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Creation timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-15T10:20:30Z"},
+        json_schema_extra=schema_example("2025-01-15T10:20:30Z"),
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=created_at_or_now,
         description="Last update timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-16T12:00:00Z"},
+        json_schema_extra=schema_example("2025-01-16T12:00:00Z"),
     )
 
-    model_config =  {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "customer": {
-                        "uni": "abc1234",
-                        "first_name": "Ada",
-                        "last_name": "Lovelace",
-                        "email": "ada@example.com",
-                        "phone": "+1-212-555-0199",
-                        "birth_date": "1815-12-10",
-                        "addresses": [
-                            {
-                                "id": "550e8400-e29b-41d4-a716-446655440000",
-                                "street": "123 Main St",
-                                "city": "London",
-                                "state": None,
-                                "postal_code": "SW1A 1AA",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "item": "Laptop",
-                    "quantity": 2,
-                    "price_per_item": 999.99,
-                    "order_date": "2023-10-05"
-                }
-            ]
-        }
-    }
+    @classmethod
+    def from_row(cls, row: dict) -> OrderRead:
+        """Build from already-validated server state without re-validating."""
+        return cls.model_construct(**row)
+
 
+ORDER_LIST_ADAPTER = TypeAdapter(list[OrderRead], config={"defer_build": True})
+orders_to_json = ORDER_LIST_ADAPTER.dump_json
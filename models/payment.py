@@ -1,200 +1,104 @@
 from __future__ import annotations
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Annotated, Iterator, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
 from uuid import UUID, uuid4
 from datetime import date, datetime
-from .person import PersonBase
+
+from ._common import OPENAPI_DOCS, PERSON_EXAMPLE, created_at_or_now, schema_example, utcnow
+
+if TYPE_CHECKING:
+    from .person import PersonBase
+
+_RECEIVER_EXAMPLE = {
+    "uni": "xyz5678",
+    "first_name": "Charles",
+    "last_name": "Babbage",
+    "email": "charles@example.com",
+    "phone": "+1-212-555-0123",
+    "birth_date": "1791-12-26",
+    "addresses": [
+        {
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "street": "456 High St",
+            "city": "Cambridge",
+            "state": None,
+            "postal_code": "CB2 1TN",
+            "country": "UK",
+        }
+    ],
+}
+
+_PAYMENT_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "sender": PERSON_EXAMPLE,
+    "receiver": _RECEIVER_EXAMPLE,
+    "amount_cents": 15075,
+    "currency": "USD",
+    "status": "completed",
+    "method": "credit card",
+    "birth_date": "1815-12-10",
+}
+
+# Field metadata shared by PaymentBase and PaymentUpdate.
+_AMOUNT_CENTS = Field(
+    ge=0,
+    description="Payment amount, in cents.",
+    json_schema_extra=schema_example(15075),
+)
+
+_CURRENCY = Field(
+    description="Currency code (e.g., USD, EUR).",
+    json_schema_extra=schema_example("USD"),
+)
+
+_STATUS = Field(
+    description="Payment status (e.g., pending, completed).",
+    json_schema_extra=schema_example("completed"),
+)
+
+_METHOD = Field(
+    description="Payment method (e.g., credit card, bank transfer).",
+    json_schema_extra=schema_example("credit card"),
+)
+
+_BIRTH_DATE = Field(
+    description="Date of birth (YYYY-MM-DD).",
+    json_schema_extra=schema_example("1815-12-10"),
+)
 
 
 class PaymentBase(BaseModel):
     id: UUID = Field(
         default_factory=uuid4,
         description="Persistent Address ID (server-generated).",
-        json_schema_extra={"example": "550e8400-e29b-41d4-a716-446655440000"},
+        json_schema_extra=schema_example("550e8400-e29b-41d4-a716-446655440000"),
     )
 
     sender: PersonBase = Field(
         None,
         description="Sending Person",
-        json_schema_extra={ 
-            "example": [
-                {
-                    "uni": "abc1234",
-                    "first_name": "Ada",
-                    "last_name": "Lovelace",
-                    "email": "ada@example.com",
-                    "phone": "+1-212-555-0199",
-                    "birth_date": "1815-12-10",
-                    "addresses": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "street": "123 Main St",
-                            "city": "London",
-                            "state": None,
-                            "postal_code": "SW1A 1AA",
-                            "country": "UK",
-                        }
-                    ],
-                }
-            ]
-        },
+        json_schema_extra=schema_example([PERSON_EXAMPLE]),
     )
 
     receiver: PersonBase = Field(
         None,
         description="Receiving Person",
-        json_schema_extra={ 
-            "example": [
-                {
-                    "uni": "abc1234",
-                    "first_name": "Ada",
-                    "last_name": "Lovelace",
-                    "email": "ada@example.com",
-                    "phone": "+1-212-555-0199",
-                    "birth_date": "1815-12-10",
-                    "addresses": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "street": "123 Main St",
-                            "city": "London",
-                            "state": None,
-                            "postal_code": "SW1A 1AA",
-                            "country": "UK",
-                        }
-                    ],
-                }
-            ]
-        },
+        json_schema_extra=schema_example([PERSON_EXAMPLE]),
     )
 
-    amount: float = Field(
-        ...,
-        description="Payment amount.",
-        json_schema_extra={"example": 150.75},
-    )
-    currency: str = Field(
-        ...,
-        description="Currency code (e.g., USD, EUR).",
-        json_schema_extra={"example": "USD"},
-    )
-    status: str = Field(
-        ...,
-        description="Payment status (e.g., pending, completed).",
-        json_schema_extra={"example": "completed"},
-    )
-    method: str = Field(
-        ...,
-        description="Payment method (e.g., credit card, bank transfer).",
-        json_schema_extra={"example": "credit card"},
-    )
-    birth_date: Optional[date] = Field(
-        None,
-        description="Date of birth (YYYY-MM-DD).",
-        json_schema_extra={"example": "1815-12-10"},
-    )
+    amount_cents: Annotated[int, _AMOUNT_CENTS]
+    currency: Annotated[str, _CURRENCY]
+    status: Annotated[str, _STATUS]
+    method: Annotated[str, _METHOD]
+    birth_date: Annotated[Optional[date], _BIRTH_DATE] = None
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "sender": {
-                        "uni": "abc1234",
-                        "first_name": "Ada",
-                        "last_name": "Lovelace",
-                        "email": "ada@example.com",
-                        "phone": "+1-212-555-0199",
-                        "birth_date": "1815-12-10",
-                        "addresses": [
-                            {
-                                "id": "550e8400-e29b-41d4-a716-446655440000",
-                                "street": "123 Main St",
-                                "city": "London",
-                                "state": None,
-                                "postal_code": "SW1A 1AA",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "receiver": {
-                        "uni": "xyz5678",
-                        "first_name": "Charles",
-                        "last_name": "Babbage",
-                        "email": "charles@example.com",
-                        "phone": "+1-212-555-0123",
-                        "birth_date": "1791-12-26",
-                        "addresses": [
-                            {
-                                "id": "123e4567-e89b-12d3-a456-426614174000",
-                                "street": "456 High St",
-                                "city": "Cambridge",
-                                "state": None,
-                                "postal_code": "CB2 1TN",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "amount": 150.75,
-                    "currency": "USD",
-                    "status": "completed",
-                    "method": "credit card",
-                    "birth_date": "1815-12-10"
-                }
-            ]
-        }
+        "defer_build": True,
+        "json_schema_extra": {"examples": [_PAYMENT_EXAMPLE]} if OPENAPI_DOCS else None,
     }
 
 class PaymentCreate(PaymentBase):
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "sender": {
-                        "uni": "abc1234",
-                        "first_name": "Ada",
-                        "last_name": "Lovelace",
-                        "email": "ada@example.com",
-                        "phone": "+1-212-555-0199",
-                        "birth_date": "1815-12-10",
-                        "addresses": [
-                            {
-                                "id": "550e8400-e29b-41d4-a716-446655440000",
-                                "street": "123 Main St",
-                                "city": "London",
-                                "state": None,
-                                "postal_code": "SW1A 1AA",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "receiver": {
-                        "uni": "xyz5678",
-                        "first_name": "Charles",
-                        "last_name": "Babbage",
-                        "email": "charles@example.com",
-                        "phone": "+1-212-555-0123",
-                        "birth_date": "1791-12-26",
-                        "addresses": [
-                            {
-                                "id": "123e4567-e89b-12d3-a456-426614174000",
-                                "street": "456 High St",
-                                "city": "Cambridge",
-                                "state": None,
-                                "postal_code": "CB2 1TN",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "amount": 150.75,
-                    "currency": "USD",
-                    "status": "completed",
-                    "method": "credit card",
-                    "birth_date": "1815-12-10"
-                }
-            ]
-        }
-    }
+    pass
 
 
 
@@ -211,35 +115,13 @@ class PaymentUpdate(BaseModel):
         description="Receiving Person"
     )
 
-    amount: Optional[float] = Field(
-        None,
-        description="Payment amount.",
-        json_schema_extra={"example": 150.75},
-    )
-
-    currency: Optional[str] = Field(
-        None,
-        description="Currency code (e.g., USD, EUR).",
-        json_schema_extra={"example": "USD"},
-    )
+    amount_cents: Annotated[Optional[int], _AMOUNT_CENTS] = None
+    currency: Annotated[Optional[str], _CURRENCY] = None
+    status: Annotated[Optional[str], _STATUS] = None
+    method: Annotated[Optional[str], _METHOD] = None
+    birth_date: Annotated[Optional[date], _BIRTH_DATE] = None
 
-    status: Optional[str] = Field(
-        None,
-        description="Payment status (e.g., pending, completed).",
-        json_schema_extra={"example": "completed"},
-    )
-
-    method: Optional[str] = Field(
-        None,
-        description="Payment method (e.g., credit card, bank transfer).",
-        json_schema_extra={"example": "credit card"},
-    )
-
-    birth_date: Optional[date] = Field(
-        None,
-        description="Date of birth (YYYY-MM-DD).",
-        json_schema_extra={"example": "1815-12-10"},
-    )
+    model_config = {"defer_build": True}
 
 
 class PaymentRead(PaymentBase):
@@ -247,66 +129,81 @@ class PaymentRead(PaymentBase):
     id: UUID = Field(
         default_factory=uuid4,
         description="Server-generated Person ID.",
-        json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
+        json_schema_extra=schema_example("99999999-9999-4999-8999-999999999999"),
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Creation timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-15T10:20:30Z"},
+        json_schema_extra=schema_example("2025-01-15T10:20:30Z"),
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=created_at_or_now,
         description="Last update timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-16T12:00:00Z"},
+        json_schema_extra=schema_example("2025-01-16T12:00:00Z"),
     )
 
+    @classmethod
+    def from_row(cls, row: dict) -> PaymentRead:
+        """Build from already-validated server state without re-validating."""
+        return cls.model_construct(**row)
+
+
+class PaymentBatch(BaseModel):
+    """Column-oriented bulk payload: index i across all columns is one payment.
+
+    Each column is validated as one list, instead of one PaymentCreate per
+    payment; ``rows()`` then yields trusted rows for ``PaymentRead.from_row``.
+    """
+    senders: List[PersonBase] = Field(..., description="Sending Person per payment.")
+    receivers: List[PersonBase] = Field(..., description="Receiving Person per payment.")
+    amounts_cents: List[Annotated[int, Field(ge=0)]] = Field(
+        ...,
+        description="Payment amount per payment, in cents.",
+    )
+    currencies: List[str] = Field(..., description="Currency code per payment.")
+    statuses: List[str] = Field(..., description="Payment status per payment.")
+    methods: List[str] = Field(..., description="Payment method per payment.")
+
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "examples": [
                 {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "sender": {
-                        "uni": "abc1234",
-                        "first_name": "Ada",
-                        "last_name": "Lovelace",
-                        "email": "ada@example.com",
-                        "phone": "+1-212-555-0199",
-                        "birth_date": "1815-12-10",
-                        "addresses": [
-                            {
-                                "id": "550e8400-e29b-41d4-a716-446655440000",
-                                "street": "123 Main St",
-                                "city": "London",
-                                "state": None,
-                                "postal_code": "SW1A 1AA",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "receiver": {
-                        "uni": "xyz5678",
-                        "first_name": "Charles",
-                        "last_name": "Babbage",
-                        "email": "charles@example.com",
-                        "phone": "+1-212-555-0123",
-                        "birth_date": "1791-12-26",
-                        "addresses": [
-                            {
-                                "id": "123e4567-e89b-12d3-a456-426614174000",
-                                "street": "456 High St",
-                                "city": "Cambridge",
-                                "state": None,
-                                "postal_code": "CB2 1TN",
-                                "country": "UK",
-                            }
-                        ],
-                    },
-                    "amount": 150.75,
-                    "currency": "USD",
-                    "status": "completed",
-                    "method": "credit card",
-                    "birth_date": "1815-12-10"
+                    "senders": [PERSON_EXAMPLE],
+                    "receivers": [_RECEIVER_EXAMPLE],
+                    "amounts_cents": [_PAYMENT_EXAMPLE["amount_cents"]],
+                    "currencies": [_PAYMENT_EXAMPLE["currency"]],
+                    "statuses": [_PAYMENT_EXAMPLE["status"]],
+                    "methods": [_PAYMENT_EXAMPLE["method"]],
                 }
             ]
-        }
+        } if OPENAPI_DOCS else None,
     }
+
+    @model_validator(mode="after")
+    def _check_column_lengths(self) -> PaymentBatch:
+        lengths = {
+            len(self.senders), len(self.receivers), len(self.amounts_cents),
+            len(self.currencies), len(self.statuses), len(self.methods),
+        }
+        if len(lengths) > 1:
+            raise ValueError("all PaymentBatch columns must have the same length")
+        return self
+
+    def rows(self) -> Iterator[dict]:
+        for sender, receiver, amount_cents, currency, status, method in zip(
+            self.senders, self.receivers, self.amounts_cents,
+            self.currencies, self.statuses, self.methods,
+        ):
+            yield {
+                "sender": sender,
+                "receiver": receiver,
+                "amount_cents": amount_cents,
+                "currency": currency,
+                "status": status,
+                "method": method,
+            }
+
+
+PAYMENT_LIST_ADAPTER = TypeAdapter(list[PaymentRead], config={"defer_build": True})
+payments_to_json = PAYMENT_LIST_ADAPTER.dump_json